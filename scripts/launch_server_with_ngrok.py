@@ -1,8 +1,9 @@
 """Launch the Massive MCP uvicorn server and an ngrok tunnel together.
 
-This helper assumes you are already running inside the desired virtual
-environment (so `sys.executable` points at the right Python) and that
-ngrok is installed and available on PATH.
+uvicorn runs inside this process on a background thread; only ngrok is
+started as a subprocess. This helper assumes you are already running inside
+the desired virtual environment and that ngrok is installed and available
+on PATH.
 
 Example:
     python scripts/launch_server_with_ngrok.py \
@@ -12,34 +13,24 @@ Example:
 from __future__ import annotations
 
 import argparse
+import atexit
 import os
 import shutil
 import signal
 import subprocess
-import sys
-from typing import List, Optional
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 from pathlib import Path
 
-import psutil
+from mcp_massive._envfile import load_env_file
 
-
-def _load_env_file(filename: str = ".env") -> None:
-    env_path = Path(__file__).resolve().parent.parent / filename
-    if not env_path.exists():
-        return
-
-    for raw_line in env_path.read_text().splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key and key not in os.environ:
-            os.environ[key] = value
+if TYPE_CHECKING:
+    import psutil
+    import uvicorn
 
 
-_load_env_file()
+load_env_file(Path(__file__).resolve().parent.parent / ".env")
 
 
 def parse_args() -> argparse.Namespace:
@@ -76,24 +67,57 @@ def parse_args() -> argparse.Namespace:
 
 
 def ensure_prereqs() -> None:
-    if not os.environ.get("MASSIVE_API_KEY"):
-        raise SystemExit("MASSIVE_API_KEY environment variable is not set.")
+    # uvicorn runs in this process, so check the key here before exposing a
+    # tunnel to a server whose every tool call would fail.
+    from mcp_massive import server as massive_server
+
+    try:
+        massive_server.ensure_api_key()
+    except RuntimeError as exc:
+        raise SystemExit(str(exc)) from exc
 
     if shutil.which("ngrok") is None:
         raise SystemExit("ngrok executable not found in PATH. Install ngrok first.")
 
 
-def free_port(port: int) -> None:
-    """Terminate any process currently listening on the given port."""
-    offenders: List[psutil.Process] = []
-    for proc in psutil.process_iter(["pid", "name"]):
+def _listening_processes(port: int) -> List[psutil.Process]:
+    """Return the processes with a socket listening on the given port."""
+    import psutil
+
+    try:
+        pids = {
+            conn.pid
+            for conn in psutil.net_connections(kind="inet")
+            if conn.pid and conn.status == psutil.CONN_LISTEN and conn.laddr.port == port
+        }
+    except psutil.AccessDenied:
+        # Some platforms (e.g. macOS) only allow the system-wide scan as
+        # root; fall back to inspecting each process we can see.
+        offenders: List[psutil.Process] = []
+        for proc in psutil.process_iter(["pid", "name"]):
+            try:
+                for conn in proc.connections(kind="inet"):
+                    if conn.status == psutil.CONN_LISTEN and conn.laddr.port == port:
+                        offenders.append(proc)
+                        break
+            except psutil.Error:
+                continue
+        return offenders
+
+    offenders = []
+    for pid in pids:
         try:
-            for conn in proc.connections(kind="inet"):
-                if conn.status == psutil.CONN_LISTEN and conn.laddr.port == port:
-                    offenders.append(proc)
-                    break
-        except psutil.Error:
+            offenders.append(psutil.Process(pid))
+        except psutil.NoSuchProcess:
             continue
+    return offenders
+
+
+def free_port(port: int) -> None:
+    """Terminate any process currently listening on the given port."""
+    import psutil
+
+    offenders = _listening_processes(port)
 
     for proc in offenders:
         try:
@@ -112,17 +136,26 @@ def free_port(port: int) -> None:
                 pass
 
 
-def build_uvicorn_cmd(host: str, port: int, transport: str) -> List[str]:
-    return [
-        sys.executable,
-        "scripts/run_server_uvicorn.py",
-        "--host",
-        host,
-        "--port",
-        str(port),
-        "--transport",
-        transport,
-    ]
+def start_uvicorn(host: str, port: int, transport: str) -> Tuple[uvicorn.Server, threading.Thread]:
+    """Serve the MCP app with uvicorn on a daemon thread in this process."""
+    import uvicorn
+
+    from run_server_uvicorn import build_app, pick_impl
+
+    config = uvicorn.Config(
+        build_app(transport),
+        host=host,
+        port=port,
+        log_level="info",
+        loop=pick_impl("uvloop", "asyncio"),
+        http=pick_impl("httptools", "h11"),
+    )
+    server = uvicorn.Server(config)
+    # Off the main thread uvicorn installs no signal handlers; shutdown is
+    # driven by _install_shutdown setting server.should_exit instead.
+    thread = threading.Thread(target=server.run, name="uvicorn", daemon=True)
+    thread.start()
+    return server, thread
 
 
 def build_ngrok_cmd(port: int, domain: Optional[str], extra: List[str]) -> List[str]:
@@ -134,44 +167,91 @@ def build_ngrok_cmd(port: int, domain: Optional[str], extra: List[str]) -> List[
     return base + list(extra)
 
 
+def _spawn(cmd: List[str]) -> subprocess.Popen:
+    """Start cmd in its own process group (POSIX) so teardown reaches its children."""
+    if os.name == "nt":
+        return subprocess.Popen(cmd)
+    return subprocess.Popen(cmd, start_new_session=True)
+
+
+# Children whose process group has already been signalled by _stop.
+_signalled: weakref.WeakSet[subprocess.Popen] = weakref.WeakSet()
+
+
+def _stop(proc: subprocess.Popen, force: bool = False) -> None:
+    """Terminate (or kill) proc together with any children it spawned."""
+    if os.name == "nt":
+        if proc.poll() is not None:
+            return
+        if force:
+            proc.kill()
+        else:
+            proc.terminate()
+        return
+    # Once the leader is reaped and its group has been signalled, the pgid may
+    # be handed to an unrelated process group, so never signal it again.
+    if proc.poll() is not None and proc in _signalled:
+        return
+    # start_new_session makes the child a group leader, so its pid is the
+    # pgid; this still reaches surviving children after the leader is reaped.
+    try:
+        os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+    _signalled.add(proc)
+
+
+def _install_shutdown(procs: List[subprocess.Popen], stop_server: Callable[[], None]) -> None:
+    """Stop the server and procs on SIGINT/SIGTERM and on any interpreter exit."""
+
+    def stop_all() -> None:
+        stop_server()
+        for proc in procs:
+            _stop(proc)
+        for proc in procs:
+            try:
+                proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                _stop(proc, force=True)
+
+    def shutdown(signum: int, _: Optional[object]) -> None:
+        print(f"Received signal {signum}, shutting down processes...")
+        stop_all()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, shutdown)
+    # Also covers unhandled exceptions, which would otherwise leak ngrok.
+    atexit.register(stop_all)
+
+
 def main() -> None:
     args = parse_args()
     ensure_prereqs()
     free_port(args.port)
 
-    uvicorn_cmd = build_uvicorn_cmd(args.host, args.port, args.transport)
     ngrok_cmd = build_ngrok_cmd(args.port, args.ngrok_domain, args.ngrok_extra_args)
 
-    print(f"Starting uvicorn: {' '.join(uvicorn_cmd)}")
-    uvicorn_proc = subprocess.Popen(uvicorn_cmd)
+    print(f"Starting uvicorn ({args.transport}) on http://{args.host}:{args.port}")
+    server, server_thread = start_uvicorn(args.host, args.port, args.transport)
+
+    def stop_server() -> None:
+        server.should_exit = True
+        server_thread.join(timeout=15)
 
     try:
         print(f"Starting ngrok: {' '.join(ngrok_cmd)}")
-        ngrok_proc = subprocess.Popen(ngrok_cmd)
+        ngrok_proc = _spawn(ngrok_cmd)
     except Exception:
-        uvicorn_proc.terminate()
-        uvicorn_proc.wait(timeout=10)
+        stop_server()
         raise
 
-    def shutdown(signum: int, _: Optional[object]) -> None:
-        print(f"Received signal {signum}, shutting down processes...")
-        for proc in (ngrok_proc, uvicorn_proc):
-            if proc.poll() is None:
-                proc.terminate()
-        for proc in (ngrok_proc, uvicorn_proc):
-            try:
-                proc.wait(timeout=15)
-            except subprocess.TimeoutExpired:
-                proc.kill()
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        signal.signal(sig, shutdown)
+    _install_shutdown([ngrok_proc], stop_server)
 
-    exit_code = uvicorn_proc.wait()
+    server_thread.join()
+    exit_code = 0 if server.started else 1
     print(f"uvicorn exited with code {exit_code}, stopping ngrok.")
-    if ngrok_proc.poll() is None:
-        ngrok_proc.terminate()
-        ngrok_proc.wait(timeout=10)
+    _stop(ngrok_proc)
+    ngrok_proc.wait(timeout=10)
 
     raise SystemExit(exit_code)
 
@@ -11,41 +11,47 @@ Usage:
   # run Streamable HTTP app
   python scripts/run_server_uvicorn.py --transport streamable-http
 
+  # run Streamable HTTP app across 4 worker processes
+  python scripts/run_server_uvicorn.py --transport streamable-http --workers 4
+
+  Multiple workers require streamable-http. Each worker sets the FastMCP
+  instance's stateless_http setting, so no session state lives in a worker
+  and any worker can answer any request. SSE keeps each session's stream in
+  one process, so it is limited to a single worker.
+
 Environment:
   MASSIVE_API_KEY must be set in the environment before running.
+
+  Installing the package's "fast" extra (pip install "mcp_massive[fast]")
+  adds uvloop and httptools, which uvicorn then uses for the event loop and
+  HTTP parser; without them it falls back to asyncio and h11.
 """
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import os
+import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import uvicorn
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from starlette.datastructures import MutableHeaders
+from mcp_massive._envfile import load_env_file
 
-from mcp_massive import server as massive_server
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
-def _load_env_file(filename: str = ".env") -> None:
-    """Load KEY=VALUE pairs from a .env file if present."""
-    env_path = Path(__file__).resolve().parent.parent / filename
-    if not env_path.exists():
-        return
+load_env_file(Path(__file__).resolve().parent.parent / ".env")
 
-    for raw_line in env_path.read_text().splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key and key not in os.environ:
-            os.environ[key] = value
 
-
-_load_env_file()
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"content-security-policy", b"default-src 'self'; connect-src *"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+]
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS)
 
 
 class SecurityHeadersMiddleware:
@@ -61,11 +67,13 @@ class SecurityHeadersMiddleware:
     async def __call__(self, scope, receive, send):
         async def send_wrapper(message):
             if message["type"] == "http.response.start":
-                headers = MutableHeaders(scope=message)
-                headers["X-Content-Type-Options"] = "nosniff"
-                headers["X-Frame-Options"] = "DENY"
-                headers["Content-Security-Policy"] = "default-src 'self'; connect-src *"
-                headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+                # ASGI header names are lowercase bytes, so the precomputed
+                # pairs can replace any existing values without re-parsing.
+                message["headers"] = [
+                    header
+                    for header in message.get("headers", ())
+                    if header[0] not in _SECURITY_HEADER_NAMES
+                ] + _SECURITY_HEADERS
             await send(message)
 
         await self.app(scope, receive, send_wrapper)
@@ -73,6 +81,10 @@ class SecurityHeadersMiddleware:
 
 def create_app(poly_mcp, transport: str = "sse") -> FastAPI:
     """Create the MCP FastAPI app with common middleware."""
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from mcp_massive import massive_client
+
     if transport == "sse":
         app = poly_mcp.sse_app()
     else:
@@ -86,29 +98,95 @@ def create_app(poly_mcp, transport: str = "sse") -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(SecurityHeadersMiddleware)
+
+    # Close the pooled Massive API client when the app shuts down.
+    inner_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_):
+        async with inner_lifespan(app_) as state:
+            yield state
+        await massive_client.aclose()
+
+    app.router.lifespan_context = lifespan
     return app
 
+
+def build_app(transport: str = "sse") -> FastAPI:
+    """Build the app for the package's poly_mcp instance."""
+    from mcp_massive import server as massive_server
+
+    return create_app(massive_server.poly_mcp, transport)
+
+
+def build_worker_app() -> FastAPI:
+    """App factory for multi-worker uvicorn: stateless streamable-http."""
+    from mcp_massive import server as massive_server
+
+    # Sessions would otherwise live in one worker's memory. Set the setting on
+    # the instance: FastMCP's constructor argument overrides FASTMCP_* env vars,
+    # and streamable_http_app() reads the setting when it is called.
+    massive_server.poly_mcp.settings.stateless_http = True
+    return create_app(massive_server.poly_mcp, "streamable-http")
+
+
+def pick_impl(preferred: str, fallback: str) -> str:
+    """Return preferred if its module is importable, else fallback."""
+    return preferred if importlib.util.find_spec(preferred) is not None else fallback
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--transport", choices=("sse", "streamable-http"), default="sse")
     parser.add_argument("--host", default=os.environ.get("FASTMCP_HOST", "127.0.0.1"))
     parser.add_argument("--port", type=int, default=int(os.environ.get("FASTMCP_PORT", "8000")))
     parser.add_argument("--log-level", choices=("debug", "info", "warning", "error", "critical"), default="info")
+    parser.add_argument("--workers", type=int, default=1, help="Number of uvicorn worker processes (default: 1)")
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.transport != "streamable-http":
+        parser.error("--workers > 1 requires --transport streamable-http")
+
+    # Heavy imports are deferred so --help and argument errors return quickly.
+    import uvicorn
+
+    from mcp_massive import server as massive_server
 
     try:
         massive_server.ensure_api_key()
     except RuntimeError as exc:
         raise SystemExit(str(exc)) from exc
 
+    # uvloop and httptools are C-accelerated; fall back to the pure-Python
+    # implementations where they are unavailable (e.g. Windows).
+    loop = pick_impl("uvloop", "asyncio")
+    http = pick_impl("httptools", "h11")
+
+    print(f"Starting MCP server ({args.transport}) on http://{args.host}:{args.port} [loop={loop}, http={http}]")
+    if args.workers > 1:
+        # Workers are spawned processes that import the factory by name, so
+        # make this script's directory importable.
+        script_dir = str(Path(__file__).resolve().parent)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        uvicorn.run(
+            f"{Path(__file__).stem}:build_worker_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            log_level=args.log_level,
+            loop=loop,
+            http=http,
+            workers=args.workers,
+        )
+        return
+
     # Use the poly_mcp instance defined in the package
     poly_mcp = massive_server.poly_mcp
 
     app = create_app(poly_mcp, args.transport)
-
-    print(f"Starting MCP server ({args.transport}) on http://{args.host}:{args.port}")
-    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
-
+    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level, loop=loop, http=http)
 
 if __name__ == "__main__":
     main()
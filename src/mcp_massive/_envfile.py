@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Union
+
+# KEY=VALUE lines; values may be wrapped in single or double quotes. Comment
+# lines and lines without "=" never match. Unquoted values run to end of line.
+_ENV_LINE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_.-]*)[ \t]*=[ \t]*(?:"([^"\n]*)"|'([^'\n]*)'|(.*?))[ \t\r]*$""",
+    re.MULTILINE,
+)
+
+# Set once a .env file has been applied; child processes inherit it along with
+# the loaded variables and can skip re-reading an unchanged file.
+_LOADED_MARKER = "MCP_MASSIVE_ENV_LOADED"
+
+
+def parse_env(text: str) -> Dict[str, str]:
+    """Parse .env file contents into a dict (later keys win)."""
+    # Exactly one of the three value alternatives matches, and it is always
+    # the last group that participated in the match.
+    return {m.group(1): m.group(m.lastindex) for m in _ENV_LINE.finditer(text)}
+
+
+def load_env_file(path: Union[str, Path]) -> None:
+    """Load KEY=VALUE pairs from a .env file into os.environ without overriding."""
+    env_path = Path(path).resolve()
+    try:
+        marker = f"{env_path}:{env_path.stat().st_mtime_ns}"
+        if os.environ.get(_LOADED_MARKER) == marker:
+            return
+        text = env_path.read_text()
+    except FileNotFoundError:
+        return
+
+    for key, value in parse_env(text).items():
+        os.environ.setdefault(key, value)
+    os.environ[_LOADED_MARKER] = marker
@@ -5,6 +5,23 @@ import csv
 import io
 from typing import Any, List, Mapping, Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON with orjson when installed, else the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. rejects NaN/Infinity); defer to the
+            # stdlib for those payloads and for its error messages.
+            pass
+    return json.loads(text)
+
 
 def json_to_csv(json_input: str | Mapping[str, Any] | Sequence[Any]) -> str:
     """
@@ -20,7 +37,7 @@ def json_to_csv(json_input: str | Mapping[str, Any] | Sequence[Any]) -> str:
     """
     # Parse JSON if it's a string
     if isinstance(json_input, str):
-        data = json.loads(json_input)
+        data = _loads(json_input)
     else:
         data = json_input
 
@@ -38,28 +55,43 @@ def json_to_csv(json_input: str | Mapping[str, Any] | Sequence[Any]) -> str:
         else:
             mapping_records.append({"value": record})
 
-    flattened_records = [_flatten_dict(record) for record in mapping_records]
-
-    if not flattened_records:
+    if not mapping_records:
         return ""
 
-    # Get all unique keys across all records (for consistent column ordering)
-    all_keys = []
-    seen = set()
-    for record in flattened_records:
-        for key in record.keys():
-            if key not in seen:
-                all_keys.append(key)
-                seen.add(key)
+    # Build rows in one pass, assigning each new key the next column in
+    # first-seen order (for consistent column ordering across records).
+    col_index: dict[str, int] = {}
+    rows: List[List[Any]] = []
+    for record in mapping_records:
+        # Most API results are already flat; only walk records that need it.
+        flat = _flatten_dict(record) if _is_nested(record) else record
+        row: List[Any] = [None] * len(col_index)
+        for key, value in flat.items():
+            i = col_index.get(key)
+            if i is None:
+                col_index[key] = len(col_index)
+                row.append(value)
+            else:
+                row[i] = value
+        rows.append(row)
 
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=all_keys, lineterminator="\n")
-    writer.writeheader()
-    writer.writerows(flattened_records)
+    writer = csv.writer(output, lineterminator="\n", quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(col_index)
+    width = len(col_index)
+    for row in rows:
+        if len(row) < width:
+            row.extend([None] * (width - len(row)))
+        writer.writerow(row)
 
     return output.getvalue()
 
 
+def _is_nested(d: Mapping[str, Any]) -> bool:
+    """Return True if any value in the mapping needs flattening."""
+    return any(isinstance(v, (Mapping, list)) for v in d.values())
+
+
 def _flatten_dict(
     d: Mapping[str, Any], parent_key: str = "", sep: str = "_"
 ) -> dict[str, Any]:
@@ -68,23 +100,31 @@ def _flatten_dict(
 
     Args:
         d: Dictionary to flatten
-        parent_key: Key from parent level (for recursion)
+        parent_key: Prefix applied to every key in the result
         sep: Separator to use between nested keys
 
     Returns:
         Flattened dictionary with no nested structures
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-        if isinstance(v, Mapping):
-            # Recursively flatten nested dicts / mappings
-            items.extend(_flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            # Convert lists to comma-separated strings
-            items.append((new_key, str(v)))
+    flat: dict[str, Any] = {}
+    # Walk depth-first with an explicit stack of item iterators so keys come
+    # out in the same order as a recursive walk, without a call per level.
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+
+            if isinstance(v, Mapping):
+                # Descend into nested dicts / mappings, resume here afterwards
+                stack.append((new_key, iter(v.items())))
+                break
+            elif isinstance(v, list):
+                # Encode lists as compact JSON (smaller and parseable, unlike repr)
+                flat[new_key] = json.dumps(v, separators=(",", ":"), ensure_ascii=False, default=str)
+            else:
+                flat[new_key] = v
         else:
-            items.append((new_key, v))
+            stack.pop()
 
-    return dict(items)
+    return flat
@@ -1,20 +1,67 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import httpx
 
 
 _BASE_URL = os.environ.get("MASSIVE_BASE_URL", "https://api.massive.com")
-_client = httpx.Client(base_url=_BASE_URL, timeout=30)
 
 
-def massive_get(path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=_BASE_URL,
+        timeout=30,
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+_client = _new_client()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, reopening it if an app shutdown closed it."""
+    global _client
+    if _client.is_closed:
+        _client = _new_client()
+    return _client
+
+
+@lru_cache(maxsize=1)
+def _get_api_key() -> str:
+    """Resolve the API key once; call ``_get_api_key.cache_clear()`` to re-read it."""
     from .server import ensure_api_key  # local import to avoid cycle during init
 
-    query = dict(params) if params else {}
-    query.setdefault("apiKey", ensure_api_key())
-    response = _client.get(path, params=query)
+    return ensure_api_key()
+
+
+async def massive_get(
+    path: str, params: Optional[Dict[str, Any]] = None, *, _no_copy: bool = False
+) -> httpx.Response:
+    """
+    GET a Massive API path, adding the API key to the query.
+
+    Caller params are copied before the key is added unless _no_copy is set,
+    which callers passing a freshly built dict use to skip the copy.
+    """
+    if params is not None and (_no_copy or "apiKey" in params):
+        query = params
+        if "apiKey" not in query:
+            query["apiKey"] = _get_api_key()
+    else:
+        query = {**(params or {}), "apiKey": _get_api_key()}
+    response = await _get_client().get(path, params=query)
     response.raise_for_status()
     return response
+
+
+async def aclose() -> None:
+    """Close the shared client and release pooled connections.
+
+    The next massive_get opens a fresh client, so a later app lifespan in the
+    same process keeps working.
+    """
+    await _client.aclose()
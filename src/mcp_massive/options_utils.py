@@ -2,25 +2,58 @@ from __future__ import annotations
 
 import math
 import re
-from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Iterable, List
 
 OCC_PATTERN = re.compile(r"^O:(?P<root>[A-Z]{1,6})(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})(?P<cp>[CP])(?P<strike>\d{8})$")
+_match_occ = OCC_PATTERN.fullmatch
 
 
 def parse_occ_strike(ticker: str) -> float:
     """
     Parse an OCC-formatted option ticker and return the strike as float.
 
+    OCC tickers are fixed-width at the tail, so only the length, prefix,
+    call/put flag and strike digits are checked; use validate_occ for a
+    full check of the root and expiration.
+
     Example: O:RZLV251107C00005500 -> 5.5
     """
-    match = OCC_PATTERN.match(ticker)
-    if not match:
+    strike = ticker[-8:]
+    if (
+        not 18 <= len(ticker) <= 23
+        or not ticker.startswith("O:")
+        or ticker[-9] not in "CP"
+        or not (strike.isascii() and strike.isdigit())
+    ):
         raise ValueError(f"Invalid OCC option ticker: {ticker}")
-    strike_int = int(match.group("strike"))
-    return strike_int / 1000.0
+    return int(strike) / 1000.0
+
+
+def validate_occ(ticker: str) -> None:
+    """Raise ValueError unless ticker is a fully well-formed OCC option ticker."""
+    if not _match_occ(ticker):
+        raise ValueError(f"Invalid OCC option ticker: {ticker}")
+
+
+def _occ_prefix(underlying: str, expiration_date: str, contract_type: str) -> str:
+    """Return the OCC ticker up to (but excluding) the 8-digit strike."""
+    exp = expiration_date.replace("-", "")
+    if len(exp) != 8:
+        raise ValueError("expiration_date must be in YYYY-MM-DD format")
+    cp = "C" if contract_type.lower().startswith("c") else "P"
+    return f"O:{underlying.upper()}{exp[2:]}{cp}"
 
 
+def _occ_strike(strike: float) -> str:
+    """Encode a strike as the OCC 8-digit thousandths field (half-up)."""
+    strike_int = math.floor(strike * 1000 + 0.5)
+    if not 0 <= strike_int < 10**8:
+        raise ValueError(f"strike out of OCC range: {strike}")
+    return f"{strike_int:08d}"
+
+
+@lru_cache(maxsize=4096)
 def build_occ_option_ticker(underlying: str, expiration_date: str, contract_type: str, strike: float) -> str:
     """
     Build an OCC-formatted option ticker from pieces.
@@ -28,26 +61,15 @@ def build_occ_option_ticker(underlying: str, expiration_date: str, contract_type
     expiration_date must be YYYY-MM-DD.
     contract_type should be 'call' or 'put'.
     """
-    exp = expiration_date.replace("-", "")
-    if len(exp) != 8:
-        raise ValueError("expiration_date must be in YYYY-MM-DD format")
-    yy = exp[2:4]
-    mm = exp[4:6]
-    dd = exp[6:8]
-    cp = "C" if contract_type.lower().startswith("c") else "P"
-    strike_int = int(Decimal(strike).scaleb(3).to_integral_value(rounding=ROUND_HALF_UP))
-    strike_str = f"{strike_int:08d}"
-    return f"O:{underlying.upper()}{yy}{mm}{dd}{cp}{strike_str}"
+    return _occ_prefix(underlying, expiration_date, contract_type) + _occ_strike(strike)
 
 
 def build_occ_option_list(
     underlying: str, expiration_date: str, contract_type: str, strikes: Iterable[float]
 ) -> List[str]:
     """Build a list of OCC tickers for the given strikes."""
-    return [
-        build_occ_option_ticker(underlying, expiration_date, contract_type, strike)
-        for strike in strikes
-    ]
+    prefix = _occ_prefix(underlying, expiration_date, contract_type)
+    return [prefix + _occ_strike(strike) for strike in strikes]
 
 
 def generate_strike_ladder(
@@ -61,6 +83,10 @@ def generate_strike_ladder(
 
     If strike is provided, returns [strike].
     Otherwise uses gte/lte boundaries (defaults to 0.5-10).
+
+    Bounds and step are rounded to 0.001, the resolution of OCC strikes, so
+    e.g. step=0.3333 behaves like step=0.333. A step that rounds to zero or
+    below raises ValueError.
     """
     if strike is not None:
         return [strike]
@@ -69,13 +95,11 @@ def generate_strike_ladder(
     end = strike_lte if strike_lte is not None else 10.0
     if end < start:
         start, end = end, start
-    strikes = []
-    current = Decimal(str(start))
-    end_dec = Decimal(str(end))
-    step_dec = Decimal(str(step))
-
-    while current <= end_dec + Decimal("0.0001"):
-        strikes.append(float(current))
-        current += step_dec
-
-    return strikes
+    # Work in integer thousandths (the OCC strike resolution) so the
+    # endpoint comparison is exact without accumulating float error.
+    start_i = round(start * 1000)
+    end_i = round(end * 1000)
+    step_i = round(step * 1000)
+    if step_i <= 0:
+        raise ValueError(f"step must be at least 0.001 (OCC strike resolution), got {step}")
+    return [i / 1000 for i in range(start_i, end_i + 1, step_i)]
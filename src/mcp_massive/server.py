@@ -569,9 +569,10 @@ async def list_universal_snapshots(
             query["limit"] = limit or query.get("limit")
             query["sort"] = sort or query.get("sort")
             try:
-                response = massive_get(
+                response = await massive_get(
                     f"/v3/snapshot/options/{underlying}",
                     {k: v for k, v in query.items() if v is not None},
+                    _no_copy=True,
                 )
                 payload = _ensure_occ_strikes(response.json())
                 if not payload.get("results"):
@@ -680,9 +681,10 @@ async def get_snapshot_ticker(
     try:
         if market_type.lower() == "stocks":
             query = dict(params) if params else {}
-            response = massive_get(
+            response = await massive_get(
                 f"/v3/snapshot/stocks/{ticker}",
                 {k: v for k, v in query.items() if v is not None},
+                _no_copy=True,
             )
             return json_to_csv(response.json())
 
@@ -761,7 +763,7 @@ async def get_option_chain_snapshot(
         if params:
             query.update(params)
 
-        response = massive_get(f"/v3/snapshot/options/{underlying_asset}", query)
+        response = await massive_get(f"/v3/snapshot/options/{underlying_asset}", query, _no_copy=True)
         payload = _ensure_occ_strikes(response.json())
         if not payload.get("results"):
             fallback_csv = _option_chain_fallback_csv(
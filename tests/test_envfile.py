@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from mcp_massive._envfile import _LOADED_MARKER, load_env_file, parse_env
+
+
+@pytest.fixture(autouse=True)
+def _isolated_environ(monkeypatch):
+    # load_env_file writes to os.environ; give each test a throwaway copy.
+    environ = os.environ.copy()
+    environ.pop(_LOADED_MARKER, None)
+    monkeypatch.setattr(os, "environ", environ)
+
+
+def test_parse_env() -> None:
+    text = (
+        "# comment\n"
+        "\n"
+        "MASSIVE_API_KEY=abc123\n"
+        "  QUOTED = \"hello world\"  \n"
+        "SINGLE='x=y'\r\n"
+        "EMPTY=\n"
+        "HASH=a#b\n"
+        "not a pair\n"
+    )
+    assert parse_env(text) == {
+        "MASSIVE_API_KEY": "abc123",
+        "QUOTED": "hello world",
+        "SINGLE": "x=y",
+        "EMPTY": "",
+        "HASH": "a#b",
+    }
+
+
+def test_load_env_file_does_not_override(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("MCP_ENV_TEST_SET=from-file\nMCP_ENV_TEST_NEW=from-file\n")
+    os.environ["MCP_ENV_TEST_SET"] = "from-env"
+
+    load_env_file(env_path)
+
+    assert os.environ["MCP_ENV_TEST_SET"] == "from-env"
+    assert os.environ["MCP_ENV_TEST_NEW"] == "from-file"
+
+
+def test_load_env_file_skips_already_loaded_file(tmp_path) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text("MCP_ENV_TEST_SKIP=first\n")
+
+    load_env_file(env_path)
+    assert os.environ["MCP_ENV_TEST_SKIP"] == "first"
+
+    # An unchanged file is not re-read, so removed keys stay removed.
+    del os.environ["MCP_ENV_TEST_SKIP"]
+    load_env_file(env_path)
+    assert "MCP_ENV_TEST_SKIP" not in os.environ
+
+    # A modified file is loaded again.
+    env_path.write_text("MCP_ENV_TEST_SKIP=second\n")
+    os.utime(env_path, ns=(0, env_path.stat().st_mtime_ns + 1_000_000_000))
+    load_env_file(env_path)
+    assert os.environ["MCP_ENV_TEST_SKIP"] == "second"
+
+
+def test_load_env_file_missing(tmp_path) -> None:
+    load_env_file(tmp_path / "missing.env")
@@ -29,10 +29,10 @@ class TestFlattenDict:
         assert result == {"level1_level2_level3": "value"}
 
     def test_dict_with_list(self):
-        """Test that lists are converted to strings."""
+        """Test that lists are converted to compact JSON strings."""
         input_dict = {"items": [1, 2, 3], "names": ["alice", "bob"]}
         result = _flatten_dict(input_dict)
-        assert result == {"items": "[1, 2, 3]", "names": "['alice', 'bob']"}
+        assert result == {"items": "[1,2,3]", "names": '["alice","bob"]'}
 
     def test_mixed_nested_structure(self):
         """Test flattening mixed nested structures."""
@@ -46,9 +46,15 @@ class TestFlattenDict:
             "simple": "value",
             "nested_field1": 100,
             "nested_field2": "text",
-            "list_field": "['a', 'b']",
+            "list_field": '["a","b"]',
         }
 
+    def test_key_order_follows_nesting(self):
+        """Test that nested keys keep their position relative to siblings."""
+        input_dict = {"a": 1, "b": {"c": 2, "d": {"e": 3}, "f": 4}, "g": 5}
+        result = _flatten_dict(input_dict)
+        assert list(result) == ["a", "b_c", "b_d_e", "b_f", "g"]
+
     def test_empty_dict(self):
         """Test flattening empty dictionary."""
         result = _flatten_dict({})
@@ -193,6 +199,12 @@ class TestJsonToCsvStdlib:
         assert rows[0]["ticker"] == "AAPL"
         assert rows[0]["price"] == "150.5"
 
+    def test_json_string_with_nan(self):
+        """Test that non-standard JSON constants accepted by json.loads still parse."""
+        results = json_to_csv('{"results": [{"ticker": "AAPL", "iv": NaN}]}')
+        rows = list(csv.DictReader(io.StringIO(results)))
+        assert rows[0]["iv"] == "nan"
+
     def test_json_dict_input(self):
         """Test that dict input works directly."""
         json_dict = {"results": [{"ticker": "AAPL", "price": 150.5}]}
@@ -371,6 +383,7 @@ class TestJsonToCsvStdlib:
         # Lists are converted to strings
         assert "tag1" in rows[0]["tags"]
         assert "tag2" in rows[0]["tags"]
+        assert json.loads(rows[0]["tags"]) == [{"name": "tag1"}, {"name": "tag2"}]
 
     def test_invalid_json_string(self):
         """Test that invalid JSON string raises appropriate error."""
@@ -425,3 +438,21 @@ class TestJsonToCsvStdlib:
         assert rows[0]["name"] == "Café"
         assert rows[0]["symbol"] == "€"
         assert rows[0]["emoji"] == "🚀"
+
+    def test_mixed_flat_and_nested_records(self):
+        """Test that flat and nested records share one consistent header."""
+        json_input = {
+            "results": [
+                {"ticker": "AAPL", "price": 150.5},
+                {"ticker": "MSFT", "day": {"open": 1, "close": 2}, "tags": ["x"]},
+            ]
+        }
+
+        results = json_to_csv(json_input)
+        reader = csv.DictReader(io.StringIO(results))
+        rows = list(reader)
+
+        assert reader.fieldnames == ["ticker", "price", "day_open", "day_close", "tags"]
+        assert rows[0]["day_open"] == ""
+        assert rows[1]["day_close"] == "2"
+        assert rows[1]["tags"] == '["x"]'
@@ -0,0 +1,73 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mcp_massive import massive_client
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": "OK"})
+
+    client = httpx.AsyncClient(base_url="https://api.massive.test", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(massive_client, "_client", client)
+    monkeypatch.setenv("MASSIVE_API_KEY", "test-key")
+    massive_client._get_api_key.cache_clear()
+    yield requests
+    massive_client._get_api_key.cache_clear()
+
+
+def test_massive_get_injects_api_key(mock_client) -> None:
+    response = asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL", {"limit": 5}))
+    assert response.json() == {"status": "OK"}
+    assert mock_client[0].url.params["apiKey"] == "test-key"
+    assert mock_client[0].url.params["limit"] == "5"
+
+
+def test_massive_get_does_not_mutate_params(mock_client) -> None:
+    params = {"limit": 5}
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL", params))
+    assert params == {"limit": 5}
+
+
+def test_massive_get_no_copy_mutates_params(mock_client) -> None:
+    params = {"limit": 5}
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL", params, _no_copy=True))
+    assert params == {"limit": 5, "apiKey": "test-key"}
+    assert mock_client[0].url.params["apiKey"] == "test-key"
+
+
+def test_massive_get_keeps_explicit_api_key(mock_client) -> None:
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL", {"apiKey": "override"}))
+    assert mock_client[0].url.params["apiKey"] == "override"
+
+
+def test_api_key_is_resolved_once(mock_client, monkeypatch) -> None:
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL"))
+    monkeypatch.setenv("MASSIVE_API_KEY", "rotated-key")
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL"))
+    assert mock_client[1].url.params["apiKey"] == "test-key"
+
+    massive_client._get_api_key.cache_clear()
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL"))
+    assert mock_client[2].url.params["apiKey"] == "rotated-key"
+
+
+def test_massive_get_reopens_client_after_aclose(mock_client, monkeypatch) -> None:
+    asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL"))
+    asyncio.run(massive_client.aclose())
+    assert massive_client._client.is_closed
+
+    reopened = httpx.AsyncClient(
+        base_url="https://api.massive.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"status": "OK"})),
+    )
+    monkeypatch.setattr(massive_client, "_new_client", lambda: reopened)
+    response = asyncio.run(massive_client.massive_get("/v3/snapshot/stocks/AAPL"))
+    assert response.json() == {"status": "OK"}
+    assert massive_client._client is reopened
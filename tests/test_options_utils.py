@@ -1,5 +1,8 @@
+import pytest
+
 from mcp_massive.options_utils import (
     parse_occ_strike,
+    validate_occ,
     build_occ_option_ticker,
     build_occ_option_list,
     generate_strike_ladder,
@@ -9,6 +12,24 @@ from mcp_massive.options_utils import (
 def test_parse_occ_strike() -> None:
     assert parse_occ_strike("O:RZLV251107C00009500") == 9.5
     assert parse_occ_strike("O:RZLV251107P00000500") == 0.5
+    assert parse_occ_strike("O:A251107C00001000") == 1.0
+    assert parse_occ_strike("O:GOOGL251107C00100000") == 100.0
+    assert parse_occ_strike("O:ABCDEF251107P00012500") == 12.5
+
+
+@pytest.mark.parametrize(
+    "ticker",
+    ["RZLV251107C00009500", "O:RZLV251107X00009500", "O:RZLV251107C-0009500", "O:C00009500", "O:ABCDEFG251107C00009500"],
+)
+def test_parse_occ_strike_rejects_malformed(ticker: str) -> None:
+    with pytest.raises(ValueError):
+        parse_occ_strike(ticker)
+
+
+def test_validate_occ() -> None:
+    validate_occ("O:RZLV251107C00009500")
+    with pytest.raises(ValueError):
+        validate_occ("O:rzlv251107C00009500")
 
 
 def test_build_occ_option_ticker_round_trip() -> None:
@@ -17,6 +38,13 @@ def test_build_occ_option_ticker_round_trip() -> None:
     assert parse_occ_strike(ticker) == 6.0
 
 
+def test_build_occ_option_ticker_is_cached() -> None:
+    build_occ_option_ticker.cache_clear()
+    first = build_occ_option_ticker("RZLV", "2025-11-07", "call", 6.0)
+    assert build_occ_option_ticker("RZLV", "2025-11-07", "call", 6.0) is first
+    assert build_occ_option_ticker.cache_info().hits == 1
+
+
 def test_build_occ_option_list() -> None:
     lst = build_occ_option_list("RZLV", "2025-11-07", "call", [0.5, 1.0])
     assert lst == ["O:RZLV251107C00000500", "O:RZLV251107C00001000"]
@@ -36,3 +64,30 @@ def test_generate_strike_ladder_with_bounds() -> None:
 
 def test_generate_strike_ladder_single() -> None:
     assert generate_strike_ladder(6.5, None, None) == [6.5]
+
+
+def test_generate_strike_ladder_fine_step_is_exact() -> None:
+    strikes = generate_strike_ladder(None, 1.0, 2.0, step=0.01)
+    assert len(strikes) == 101
+    assert strikes[1] == 1.01
+    assert strikes[-1] == 2.0
+
+
+def test_build_occ_option_ticker_rounds_half_up() -> None:
+    assert build_occ_option_ticker("RZLV", "2025-11-07", "put", 12.3455).endswith("P00012346")
+    assert build_occ_option_ticker("RZLV", "2025-11-07", "put", 0.1 + 0.2).endswith("P00000300")
+
+
+def test_build_occ_option_ticker_rejects_out_of_range_strike() -> None:
+    with pytest.raises(ValueError):
+        build_occ_option_ticker("RZLV", "2025-11-07", "call", -1.0)
+
+
+def test_generate_strike_ladder_rounds_to_thousandths() -> None:
+    assert generate_strike_ladder(None, 1.0, 2.0, step=0.3333) == [1.0, 1.333, 1.666, 1.999]
+
+
+@pytest.mark.parametrize("step", [0.0004, 0.0, -0.5])
+def test_generate_strike_ladder_rejects_sub_resolution_step(step: float) -> None:
+    with pytest.raises(ValueError, match="0.001"):
+        generate_strike_ladder(None, 1.0, 2.0, step=step)